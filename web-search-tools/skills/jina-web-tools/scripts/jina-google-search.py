@@ -10,15 +10,22 @@ Usage:
     uv run jina-google-search.py "your search query"
     uv run jina-google-search.py "your search query" --num 20
     uv run jina-google-search.py "your search query" --json
+    printf 'query one\nquery two\n' | uv run jina-google-search.py --batch
 """
 
 import argparse
 import json
 import re
 import sys
+from itertools import takewhile
 from urllib.parse import quote_plus
 
 import requests
+from requests.adapters import HTTPAdapter
+
+# Shared session so repeated requests reuse pooled keep-alive connections
+SESSION = requests.Session()
+SESSION.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=8))
 
 # Domains to filter out
 FILTER_DOMAINS = [
@@ -29,16 +36,53 @@ FILTER_DOMAINS = [
     "googleusercontent.com",
 ]
 
+# Filtered domains, image files and blob URLs in a single pass
+FILTER_RE = re.compile(
+    '|'.join(re.escape(d) for d in FILTER_DOMAINS)
+    + r'|\.(?:png|jpg|gif|svg)(?:$|[?#])|^blob:',
+    re.I,
+)
+
+# Pattern for search result headers: [### Title ...](URL)
+# Title can contain ] so we match greedily up to ](http
+RESULT_RE = re.compile(r'^\[### (.+)\]\((https?://[^)]+)\)$')
+
+# Title / URL / description cleanup patterns
+TITLE_IMAGE_RE = re.compile(r'\s*!\[.*$')
+BREADCRUMB_RE = re.compile(r'[\\›»].*$')
+WHITESPACE_RE = re.compile(r'\s+')
+URL_FRAGMENT_RE = re.compile(r'[#?].*$')
+EMPHASIS_RE = re.compile(r'_([^_]+)_')
+READ_MORE_RE = re.compile(r'\[Read more\].*$')
+DATE_PREFIX_RE = re.compile(r'^[A-Z][a-z]{2} \d{1,2}, \d{4} — ')
+
+# Description noise: links, images, bullets and bare domain lines
+NOISE_RE = re.compile(r'^(?:\[|http|!\[|\*|(?i:[a-z0-9.-]+\.[a-z]{2,})$)')
+
 
 def should_filter(url: str) -> bool:
     """Check if URL should be filtered out."""
-    for domain in FILTER_DOMAINS:
-        if domain in url:
-            return True
-    # Filter blob URLs and image files
-    if url.startswith("blob:") or re.search(r'\.(png|jpg|gif|svg)$', url, re.I):
-        return True
-    return False
+    return FILTER_RE.search(url) is not None
+
+
+def is_section_break(line: str) -> bool:
+    """Check if a stripped line starts the next result or section."""
+    return RESULT_RE.match(line) is not None or line.startswith('##')
+
+
+def is_description(line: str) -> bool:
+    """Check if a stripped line looks like a result description."""
+    return not (len(line) < 30 or
+                NOISE_RE.match(line) or
+                'feedback' in line.lower())
+
+
+def clean_description(line: str) -> str:
+    """Strip emphasis, [Read more] links and leading dates from a description."""
+    desc = EMPHASIS_RE.sub(r'\1', line)  # Remove _emphasis_
+    desc = READ_MORE_RE.sub('', desc)  # Remove [Read more]
+    desc = DATE_PREFIX_RE.sub('', desc)  # Remove dates
+    return desc.strip()
 
 
 def fetch_jina(query: str, num: int | None = None) -> str:
@@ -48,7 +92,7 @@ def fetch_jina(query: str, num: int | None = None) -> str:
     if num:
         url += f"&num={num}"
 
-    response = requests.get(url, timeout=30)
+    response = SESSION.get(url, timeout=30)
     response.raise_for_status()
     return response.text
 
@@ -58,16 +102,12 @@ def parse_results(content: str) -> list[dict]:
     results = []
     seen_urls = set()
 
-    lines = content.split('\n')
-
-    # Pattern for search result headers: [### Title ...](URL)
-    # Title can contain ] so we match greedily up to ](http
-    result_pattern = re.compile(r'^\[### (.+)\]\((https?://[^)]+)\)$')
+    lines = content.splitlines()
 
     i = 0
     while i < len(lines):
         line = lines[i]
-        match = result_pattern.match(line)
+        match = RESULT_RE.match(line)
 
         if match:
             raw_title = match.group(1)
@@ -75,13 +115,13 @@ def parse_results(content: str) -> list[dict]:
 
             # Clean title - format is: "Title ![Image](blob) SiteName URL"
             # Remove everything from the image markdown onwards
-            title = re.sub(r'\s*!\[.*$', '', raw_title)
-            title = re.sub(r'[\\›»].*$', '', title)  # Remove breadcrumb stuff
-            title = re.sub(r'\s+', ' ', title)  # Normalize whitespace
+            title = TITLE_IMAGE_RE.sub('', raw_title)
+            title = BREADCRUMB_RE.sub('', title)  # Remove breadcrumb stuff
+            title = WHITESPACE_RE.sub(' ', title)  # Normalize whitespace
             title = title.strip()
 
             # Clean URL
-            clean_url = re.sub(r'[#?].*$', '', url)
+            clean_url = URL_FRAGMENT_RE.sub('', url)
 
             if should_filter(url) or clean_url in seen_urls or not title:
                 i += 1
@@ -89,36 +129,12 @@ def parse_results(content: str) -> list[dict]:
 
             seen_urls.add(clean_url)
 
-            # Look for description in next ~10 lines
-            description = ""
-            for j in range(i + 1, min(i + 10, len(lines))):
-                next_line = lines[j].strip()
-
-                # Stop at next result or section
-                if result_pattern.match(next_line) or next_line.startswith('##'):
-                    break
-
-                # Skip noise
-                if (next_line.startswith('[') or
-                    next_line.startswith('http') or
-                    next_line.startswith('![') or
-                    next_line.startswith('*') or
-                    'feedback' in next_line.lower() or
-                    re.match(r'^[a-z0-9.-]+\.[a-z]{2,}$', next_line, re.I) or
-                    len(next_line) < 30):
-                    continue
-
-                # Found a description candidate
-                # Clean it up
-                desc = next_line
-                desc = re.sub(r'_([^_]+)_', r'\1', desc)  # Remove _emphasis_
-                desc = re.sub(r'\[Read more\].*$', '', desc)  # Remove [Read more]
-                desc = re.sub(r'^[A-Z][a-z]{2} \d{1,2}, \d{4} — ', '', desc)  # Remove dates
-                desc = desc.strip()
-
-                if len(desc) > 30:
-                    description = desc
-                    break
+            # Look for description in next ~10 lines, stopping at the next
+            # result or section
+            window = (line.strip() for line in lines[i + 1:i + 10])
+            candidates = takewhile(lambda line: not is_section_break(line), window)
+            cleaned = map(clean_description, filter(is_description, candidates))
+            description = next((desc for desc in cleaned if len(desc) > 30), "")
 
             results.append({
                 "title": title,
@@ -133,28 +149,59 @@ def parse_results(content: str) -> list[dict]:
 
 def main():
     parser = argparse.ArgumentParser(description="Google search via Jina")
-    parser.add_argument("query", help="Search query")
+    parser.add_argument("query", nargs="?", help="Search query")
     parser.add_argument("--num", type=int, help="Number of results")
     parser.add_argument("--json", action="store_true", help="Output as JSON")
+    parser.add_argument("--batch", action="store_true",
+                        help="Read newline-separated queries from stdin")
 
     args = parser.parse_args()
 
-    try:
-        content = fetch_jina(args.query, args.num)
-        results = parse_results(content)
+    if args.batch:
+        if args.query:
+            parser.error("queries are read from stdin with --batch; don't pass one as an argument")
+        queries = [line.strip() for line in sys.stdin if line.strip()]
+    elif args.query:
+        queries = [args.query]
+    else:
+        parser.error("a search query is required unless --batch is given")
+
+    failed = False
+    batch_results = []
+
+    for query in queries:
+        try:
+            content = fetch_jina(query, args.num)
+            results = parse_results(content)
+        except requests.RequestException as e:
+            prefix = f"'{query}': " if args.batch else ""
+            print(f"Error fetching results: {prefix}{e}", file=sys.stderr)
+            failed = True
+            continue
 
         if args.json:
-            print(json.dumps(results, indent=2))
+            batch_results.append({"query": query, "results": results})
+            continue
+
+        # Buffer the human-readable output and write it once
+        out = [f"# {query}\n"] if args.batch else []
+        for r in results:
+            out.append(f"## {r['title']}")
+            out.append(r['url'])
+            if r['description']:
+                out.append(r['description'])
+            out.append("")
+        if out:
+            sys.stdout.write("\n".join(out) + "\n")
+
+    # JSON output: the result list for one query, query/results pairs in batch mode
+    if args.json and batch_results:
+        if args.batch:
+            print(json.dumps(batch_results, indent=2))
         else:
-            for r in results:
-                print(f"## {r['title']}")
-                print(r['url'])
-                if r['description']:
-                    print(r['description'])
-                print()
-
-    except requests.RequestException as e:
-        print(f"Error fetching results: {e}", file=sys.stderr)
+            print(json.dumps(batch_results[0]["results"], indent=2))
+
+    if failed:
         sys.exit(1)
 
 
@@ -1,7 +1,7 @@
 #!/usr/bin/env -S uv run --script
 # /// script
 # requires-python = ">=3.10"
-# dependencies = ["yt-dlp"]
+# dependencies = ["yt-dlp", "orjson"]
 # ///
 """
 youtube-channel.py - Explore a YouTuber's channel
@@ -13,16 +13,78 @@ Usage:
     uv run youtube-channel.py "@HealthyGamerGG" --search "anxiety"
     uv run youtube-channel.py "@HealthyGamerGG" --json
     uv run youtube-channel.py "@HealthyGamerGG" --type shorts
+    printf '@ChannelA\n@ChannelB\n' | uv run youtube-channel.py --batch
 """
 
 import argparse
+import atexit
 import json
 import re
 import sys
+from dataclasses import asdict, dataclass
+from functools import lru_cache
+from operator import attrgetter
 from typing import Optional
 
 import yt_dlp
 
+try:
+    import orjson
+
+    def dumps(obj) -> str:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+except ImportError:  # Running without uv's managed dependencies
+    def dumps(obj) -> str:
+        return json.dumps(obj, indent=2, ensure_ascii=False)
+
+# Trailing content-type tab on a channel URL
+URL_SUFFIX_RE = re.compile(r"/(?:videos|shorts|streams)/?$")
+
+# YoutubeDL instances keyed by their options, reused across calls
+YDL_CACHE: dict = {}
+
+
+def get_ydl(ydl_opts: dict) -> yt_dlp.YoutubeDL:
+    """Return a cached YoutubeDL for these options, creating it on first use"""
+    key = tuple(sorted(ydl_opts.items()))
+    ydl = YDL_CACHE.get(key)
+    if ydl is None:
+        ydl = YDL_CACHE[key] = yt_dlp.YoutubeDL(ydl_opts)
+        # Cached instances outlive any `with` block, so close them at exit
+        atexit.register(ydl.close)
+    return ydl
+
+
+@lru_cache(maxsize=4096)
+def format_duration(seconds: int) -> str:
+    """Convert seconds to human-readable duration"""
+    if not seconds:
+        return "0:00"
+    hours = seconds // 3600
+    minutes = (seconds % 3600) // 60
+    secs = seconds % 60
+    if hours > 0:
+        return f"{hours}:{minutes:02d}:{secs:02d}"
+    return f"{minutes}:{secs:02d}"
+
+
+@dataclass(slots=True)
+class VideoRec:
+    """A single channel entry"""
+    index: int
+    id: str
+    title: str
+    url: str
+    duration: int
+    duration_human: str
+    views: int
+    upload_date: Optional[str] = None
+    description_snippet: Optional[str] = None
+
+    def to_dict(self) -> dict:
+        """Serialize for output, omitting optional fields that are unset"""
+        return {k: v for k, v in asdict(self).items() if v is not None}
+
 
 class YouTubeChannelExplorer:
     def __init__(self, quiet: bool = False):
@@ -66,7 +128,7 @@ class YouTubeChannelExplorer:
         """Get videos from a channel with optional filtering and sorting"""
 
         # Adjust URL for content type
-        base_url = re.sub(r"/(videos|shorts|streams)/?$", "", channel_url)
+        base_url = URL_SUFFIX_RE.sub("", channel_url)
         if content_type == "shorts":
             channel_url = base_url + "/shorts"
         elif content_type == "streams":
@@ -83,106 +145,118 @@ class YouTubeChannelExplorer:
             'ignoreerrors': True,
         }
 
-        try:
-            with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-                self.log("Extracting channel info...")
-                info = ydl.extract_info(channel_url, download=False)
-
-                if not info:
-                    return {"error": "Could not fetch channel information"}
-
-                entries = info.get('entries', [])
-                if not entries:
-                    return {"error": "No videos found"}
+        # Without search or a global sort only the first `limit` entries are
+        # needed, so let yt-dlp stop extracting there
+        bounded = bool(limit) and not search and sort_by == "recency"
+        # Full extraction (--with-dates) yields None for private or members-only
+        # videos, and later entries have to fill those gaps, so only flat
+        # listings stop at the limit
+        truncated = bounded and not with_dates
+        if truncated:
+            ydl_opts['playlistend'] = limit
 
-                # Convert generator to list if needed
-                entries = list(entries)
-
-                channel_name = info.get('channel', info.get('uploader', 'Unknown'))
-                channel_id = info.get('channel_id', info.get('uploader_id', ''))
+        try:
+            ydl = get_ydl(ydl_opts)
+            self.log("Extracting channel info...")
+            info = ydl.extract_info(channel_url, download=False)
+
+            if not info:
+                return {"error": "Could not fetch channel information"}
+
+            entries = info.get('entries', [])
+            if not entries:
+                return {"error": "No videos found"}
+
+            channel_name = info.get('channel', info.get('uploader', 'Unknown'))
+            channel_id = info.get('channel_id', info.get('uploader_id', ''))
+
+            # extract_info has already resolved the entries into a list, so
+            # counting is free. With playlistend set it only holds the first
+            # `limit` entries, and the channel total is whatever yt-dlp reports
+            # (None when it stopped early)
+            entries = list(entries)
+            if truncated:
+                total_count = info.get('playlist_count')
+            else:
                 total_count = len(entries)
-
                 self.log(f"Found {total_count} items")
 
-                # Process entries
-                videos = []
-                for i, entry in enumerate(entries):
-                    if entry is None:
-                        continue
-
-                    video = {
-                        "index": i + 1,
-                        "id": entry.get('id', ''),
-                        "title": entry.get('title', 'Unknown'),
-                        "url": f"https://youtube.com/watch?v={entry.get('id', '')}",
-                        "duration": entry.get('duration') or 0,
-                        "duration_human": self._format_duration(entry.get('duration')),
-                        "views": entry.get('view_count') or 0,
-                    }
-
-                    # Add upload date if available (slower fetch mode)
-                    if with_dates and entry.get('upload_date'):
-                        video["upload_date"] = entry.get('upload_date')
-
-                    # Add description snippet if available
-                    desc = entry.get('description', '')
-                    if desc:
-                        video["description_snippet"] = desc[:200] + "..." if len(desc) > 200 else desc
-
-                    videos.append(video)
-
-                # Filter by search term
-                if search:
-                    search_lower = search.lower()
-                    videos = [
-                        v for v in videos
-                        if search_lower in v['title'].lower()
-                        or search_lower in v.get('description_snippet', '').lower()
-                    ]
-                    self.log(f"Filtered to {len(videos)} videos matching '{search}'")
-
-                # Sort
-                if sort_by == "views":
-                    videos.sort(key=lambda x: x['views'], reverse=True)
-                elif sort_by == "duration":
-                    videos.sort(key=lambda x: x['duration'], reverse=True)
-                elif sort_by == "duration_asc":
-                    videos.sort(key=lambda x: x['duration'])
-                # recency is already the default order from YouTube
-
-                # Apply limit
-                if limit and limit > 0:
-                    videos = videos[:limit]
-
-                return {
-                    "channel": channel_name,
-                    "channel_id": channel_id,
-                    "channel_url": base_url,
-                    "content_type": content_type,
-                    "total_count": total_count,
-                    "returned_count": len(videos),
-                    "sort": sort_by,
-                    "search": search,
-                    "videos": videos,
-                }
+            # Process entries
+            videos = []
+            for i, entry in enumerate(entries):
+                if entry is None:
+                    continue
+
+                vid = entry.get('id') or ''
+                duration = entry.get('duration')
+                upload_date = entry.get('upload_date')
+                desc = entry.get('description') or ''
+
+                video = VideoRec(
+                    index=i + 1,
+                    id=vid,
+                    title=entry.get('title', 'Unknown'),
+                    url="https://youtube.com/watch?v=" + vid,
+                    duration=duration or 0,
+                    duration_human=format_duration(int(duration or 0)),
+                    views=entry.get('view_count') or 0,
+                )
+
+                # Add upload date if available (slower fetch mode)
+                if with_dates and upload_date:
+                    video.upload_date = upload_date
+
+                # Add description snippet if available
+                if desc:
+                    video.description_snippet = desc[:200] + "..." if len(desc) > 200 else desc
+
+                videos.append(video)
+                if bounded and len(videos) >= limit:
+                    break
+
+            if bounded and not videos:
+                return {"error": "No videos found"}
+
+            # Filter by search term
+            if search:
+                search_re = re.compile(re.escape(search), re.IGNORECASE)
+                videos = [
+                    v for v in videos
+                    if search_re.search(v.title)
+                    or (v.description_snippet and search_re.search(v.description_snippet))
+                ]
+                self.log(f"Filtered to {len(videos)} videos matching '{search}'")
+
+            # Sort
+            if sort_by == "views":
+                videos.sort(key=attrgetter('views'), reverse=True)
+            elif sort_by == "duration":
+                videos.sort(key=attrgetter('duration'), reverse=True)
+            elif sort_by == "duration_asc":
+                videos.sort(key=attrgetter('duration'))
+            # recency is already the default order from YouTube
+
+            # Apply limit
+            if limit and limit > 0:
+                videos = videos[:limit]
+
+            return {
+                "channel": channel_name,
+                "channel_id": channel_id,
+                "channel_url": base_url,
+                "content_type": content_type,
+                "total_count": total_count,
+                "returned_count": len(videos),
+                "sort": sort_by,
+                "search": search,
+                "videos": [v.to_dict() for v in videos],
+            }
 
         except yt_dlp.utils.DownloadError as e:
             return {"error": f"Download error: {str(e)}"}
         except Exception as e:
             return {"error": f"Error: {str(e)}"}
 
-    def _format_duration(self, seconds: Optional[float]) -> str:
-        """Convert seconds to human-readable duration"""
-        if not seconds:
-            return "0:00"
-        seconds = int(seconds)
-        hours = seconds // 3600
-        minutes = (seconds % 3600) // 60
-        secs = seconds % 60
-        if hours > 0:
-            return f"{hours}:{minutes:02d}:{secs:02d}"
-        return f"{minutes}:{secs:02d}"
-
 
 def main():
     parser = argparse.ArgumentParser(
@@ -196,9 +270,10 @@ Examples:
   %(prog)s "@HealthyGamerGG" --search "anxiety" # Search in titles
   %(prog)s "@HealthyGamerGG" --type shorts      # List shorts only
   %(prog)s "@HealthyGamerGG" --json             # Output as JSON
+  %(prog)s --batch < channels.txt               # One channel per line
         """
     )
-    parser.add_argument("channel", help="YouTube channel URL, @handle, or channel ID")
+    parser.add_argument("channel", nargs="?", help="YouTube channel URL, @handle, or channel ID")
     parser.add_argument("--limit", "-n", type=int, default=20,
                         help="Number of videos to return (default: 20, use 0 for all)")
     parser.add_argument("--sort", "-s", choices=["recency", "views", "duration", "duration_asc"],
@@ -212,54 +287,84 @@ Examples:
     parser.add_argument("--quiet", action="store_true", help="Suppress progress messages")
     parser.add_argument("--ids-only", action="store_true",
                         help="Output only video IDs (one per line)")
+    parser.add_argument("--batch", action="store_true",
+                        help="Read newline-separated channels from stdin")
 
     args = parser.parse_args()
 
-    explorer = YouTubeChannelExplorer(quiet=args.quiet or args.json or args.ids_only)
+    if args.batch:
+        if args.channel:
+            parser.error("channels are read from stdin with --batch; don't pass one as an argument")
+        channels = [line.strip() for line in sys.stdin if line.strip()]
+    elif args.channel:
+        channels = [args.channel]
+    else:
+        parser.error("a channel is required unless --batch is given")
 
-    channel_url = explorer.normalize_channel_url(args.channel)
+    explorer = YouTubeChannelExplorer(quiet=args.quiet or args.json or args.ids_only)
 
     # Use 0 as "no limit"
     limit = args.limit if args.limit > 0 else None
 
-    result = explorer.get_channel_videos(
-        channel_url,
-        limit=limit,
-        sort_by=args.sort,
-        search=args.search,
-        content_type=args.type,
-        with_dates=args.with_dates,
-    )
-
-    # Handle errors
-    if "error" in result:
-        if args.json:
-            print(json.dumps(result, indent=2))
+    failed = False
+    json_results = []
+
+    for channel in channels:
+        channel_url = explorer.normalize_channel_url(channel)
+
+        result = explorer.get_channel_videos(
+            channel_url,
+            limit=limit,
+            sort_by=args.sort,
+            search=args.search,
+            content_type=args.type,
+            with_dates=args.with_dates,
+        )
+
+        # --ids-only takes precedence over --json so the output stays pipeable
+        if args.json and not args.ids_only:
+            json_results.append(result)
+            failed = failed or "error" in result
+            continue
+
+        # Handle errors
+        if "error" in result:
+            prefix = f"{channel}: " if args.batch else ""
+            print(f"Error: {prefix}{result['error']}", file=sys.stderr)
+            failed = True
+            continue
+
+        # Output formats
+        if args.ids_only:
+            sys.stdout.write("".join(video["id"] + "\n" for video in result["videos"]))
         else:
-            print(f"Error: {result['error']}", file=sys.stderr)
+            # Human-readable output, buffered and written once
+            out = [
+                f"Channel: {result['channel']}",
+                f"Total {result['content_type']}: "
+                + (f"{result['total_count']}" if result['total_count'] is not None
+                   else f">= {result['returned_count']}"),
+                f"Showing: {result['returned_count']} (sorted by {result['sort']})",
+            ]
+            if result.get('search'):
+                out.append(f"Search: '{result['search']}'")
+            out.append("-" * 60)
+
+            for video in result["videos"]:
+                views_str = f"{video['views']:,}" if video['views'] else "N/A"
+                out.append(f"{video['index']:3d}. [{video['duration_human']:>8}] {video['title'][:50]}\n"
+                           f"     {views_str} views | {video['url']}\n")
+
+            sys.stdout.write("\n".join(out) + "\n")
+
+    # JSON output: a single object for one channel, a list in batch mode
+    if args.json and json_results:
+        payload = json_results if args.batch else json_results[0]
+        print(dumps(payload))
+
+    if failed:
         sys.exit(1)
 
-    # Output formats
-    if args.ids_only:
-        for video in result["videos"]:
-            print(video["id"])
-    elif args.json:
-        print(json.dumps(result, indent=2, ensure_ascii=False))
-    else:
-        # Human-readable output
-        print(f"Channel: {result['channel']}")
-        print(f"Total {result['content_type']}: {result['total_count']}")
-        print(f"Showing: {result['returned_count']} (sorted by {result['sort']})")
-        if result.get('search'):
-            print(f"Search: '{result['search']}'")
-        print("-" * 60)
-
-        for video in result["videos"]:
-            views_str = f"{video['views']:,}" if video['views'] else "N/A"
-            print(f"{video['index']:3d}. [{video['duration_human']:>8}] {video['title'][:50]}")
-            print(f"     {views_str} views | {video['url']}")
-            print()
-
 
 if __name__ == "__main__":
     main()
@@ -1,7 +1,7 @@
 #!/usr/bin/env -S uv run --script
 # /// script
 # requires-python = ">=3.10"
-# dependencies = ["yt-dlp", "pyperclip", "requests"]
+# dependencies = ["yt-dlp", "pyperclip", "requests", "orjson"]
 # ///
 """
 youtube-transcript.py - Download YouTube video transcripts
@@ -11,21 +11,62 @@ Usage:
     uv run youtube-transcript.py "https://youtube.com/watch?v=..." --lang zh-Hant
     uv run youtube-transcript.py "https://youtube.com/watch?v=..." --json
     uv run youtube-transcript.py "https://youtube.com/watch?v=..." --list-langs
+    uv run youtube-transcript.py "URL1" "URL2" "URL3"
+    uv run youtube-transcript.py --batch < urls.txt
+    uv run youtube-transcript.py "https://youtube.com/watch?v=..." --no-cache
 """
 
 import argparse
+import atexit
+import html
 import json
+import os
 import re
 import sys
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from itertools import groupby
+from pathlib import Path
 from typing import Optional
 
 import requests
+from requests.adapters import HTTPAdapter
 import yt_dlp
 
+try:
+    import orjson
+
+    def dumps(obj) -> str:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+except ImportError:  # Running without uv's managed dependencies
+    def dumps(obj) -> str:
+        return json.dumps(obj, indent=2, ensure_ascii=False)
+
+# Shared session so repeated requests reuse pooled keep-alive connections
+SESSION = requests.Session()
+SESSION.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=8))
+
+# Video ID after "v=" or any "/" (covers watch, embed/ and youtu.be/ URLs)
+VIDEO_ID_RE = re.compile(r'(?:v=|/)([0-9A-Za-z_-]{11})')
+
+# On-disk transcript cache
+CACHE_DIR = (Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache")
+             / "jina-web-tools" / "transcripts")
+CACHE_TTL = 7 * 24 * 3600  # seconds
+# Language codes safe to use in a cache file name (no path separators or dots)
+CACHE_LANG_RE = re.compile(r'[A-Za-z0-9_-]+')
+
+# Subtitle parsing patterns
+VTT_TAG_RE = re.compile(r'<[^>]+>')
+M3U8_URL_RE = re.compile(r'https://\S+')
+
 
 class YouTubeTranscriptDownloader:
-    def __init__(self, quiet: bool = False):
+    def __init__(self, quiet: bool = False, use_cache: bool = True):
         self.quiet = quiet
+        self.use_cache = use_cache
         self.ydl_opts = {
             'writeautomaticsub': True,
             'skip_download': True,
@@ -33,171 +74,215 @@ class YouTubeTranscriptDownloader:
             'no_warnings': True,
             'extract_flat': False,
         }
+        # One YoutubeDL per worker thread, reused across videos
+        self._local = threading.local()
 
     def log(self, msg: str):
         if not self.quiet:
-            print(msg, file=sys.stderr)
+            # Worker threads tag their messages with the video they are on
+            prefix = getattr(self._local, 'log_prefix', '')
+            print(prefix + msg, file=sys.stderr)
 
     def extract_video_id(self, url: str) -> Optional[str]:
-        patterns = [
-            r'(?:v=|\/)([0-9A-Za-z_-]{11}).*',
-            r'(?:embed\/)([0-9A-Za-z_-]{11})',
-            r'(?:youtu\.be\/)([0-9A-Za-z_-]{11})'
-        ]
-        for pattern in patterns:
-            match = re.search(pattern, url)
-            if match:
-                return match.group(1)
-        return None
+        match = VIDEO_ID_RE.search(url)
+        return match.group(1) if match else None
+
+    def _get_ydl(self) -> yt_dlp.YoutubeDL:
+        ydl = getattr(self._local, 'ydl', None)
+        if ydl is None:
+            ydl = self._local.ydl = yt_dlp.YoutubeDL(self.ydl_opts)
+            # Reused instances outlive any `with` block, so close them at exit
+            atexit.register(ydl.close)
+        return ydl
+
+    def _cache_path(self, video_url: str, preferred_lang: Optional[str]) -> Optional[Path]:
+        video_id = self.extract_video_id(video_url)
+        if not self.use_cache or not video_id:
+            return None
+        if preferred_lang and not CACHE_LANG_RE.fullmatch(preferred_lang):
+            return None
+        return CACHE_DIR / f"{video_id}.{preferred_lang or 'auto'}.json"
+
+    def _load_cached(self, path: Path) -> Optional[dict]:
+        try:
+            if path.stat().st_mtime < time.time() - CACHE_TTL:
+                return None
+            with path.open(encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def _store_cached(self, path: Path, result: dict):
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            with tempfile.NamedTemporaryFile("w", encoding="utf-8", dir=path.parent,
+                                             suffix=".tmp", delete=False) as f:
+                json.dump(result, f, ensure_ascii=False)
+            try:
+                os.replace(f.name, path)
+            except OSError:
+                os.unlink(f.name)
+                raise
+        except OSError as e:
+            self.log(f"Could not write cache: {e}")
 
     def get_transcript(self, video_url: str, preferred_lang: Optional[str] = None) -> dict:
-        """Get transcript and metadata"""
+        """Get transcript and metadata, served from the on-disk cache when fresh"""
+        cache_path = self._cache_path(video_url, preferred_lang)
+        if cache_path:
+            cached = self._load_cached(cache_path)
+            if cached is not None:
+                self.log(f"Using cached transcript: {video_url}")
+                return cached
+
+        result = self._fetch_transcript(video_url, preferred_lang)
+        if cache_path and "error" not in result:
+            self._store_cached(cache_path, result)
+        return result
+
+    def _fetch_transcript(self, video_url: str, preferred_lang: Optional[str] = None) -> dict:
         self.log(f"Processing: {video_url}")
 
-        with yt_dlp.YoutubeDL(self.ydl_opts) as ydl:
-            try:
-                self.log("Fetching video info...")
-                info = ydl.extract_info(video_url, download=False)
-
-                title = info.get('title', 'Unknown')
-                video_id = info.get('id', '')
-                duration = info.get('duration', 0)
-                channel = info.get('channel', info.get('uploader', 'Unknown'))
-
-                self.log(f"Title: {title}")
-
-                # Get captions
-                auto_captions = info.get('automatic_captions', {})
-                subtitles = info.get('subtitles', {})
-
-                # Merge manual subtitles (they take priority)
-                all_captions = {**auto_captions, **subtitles}
-
-                if not all_captions:
-                    return {"error": "No subtitles available for this video"}
-
-                available_langs = list(all_captions.keys())
-
-                # Select language
-                selected_lang = None
-                original_lang = info.get('language') or info.get('original_language')
-
-                if preferred_lang:
-                    if preferred_lang in all_captions:
-                        selected_lang = preferred_lang
-                    else:
-                        # Partial match
-                        for lang in all_captions:
-                            if preferred_lang.lower() in lang.lower():
-                                selected_lang = lang
-                                break
-                        if not selected_lang:
-                            return {
-                                "error": f"Language '{preferred_lang}' not found",
-                                "available_languages": available_langs
-                            }
+        ydl = self._get_ydl()
+        try:
+            self.log("Fetching video info...")
+            info = ydl.extract_info(video_url, download=False)
+
+            title = info.get('title', 'Unknown')
+            video_id = info.get('id', '')
+            duration = info.get('duration', 0)
+            channel = info.get('channel', info.get('uploader', 'Unknown'))
+
+            self.log(f"Title: {title}")
+
+            # Get captions
+            auto_captions = info.get('automatic_captions', {})
+            subtitles = info.get('subtitles', {})
+
+            # Merge manual subtitles (they take priority)
+            all_captions = {**auto_captions, **subtitles}
+
+            if not all_captions:
+                return {"error": "No subtitles available for this video"}
+
+            available_langs = list(all_captions.keys())
+
+            # Select language
+            selected_lang = None
+            original_lang = info.get('language') or info.get('original_language')
+
+            if preferred_lang:
+                if preferred_lang in all_captions:
+                    selected_lang = preferred_lang
                 else:
-                    # Auto-select: original language > English > first available
-                    if original_lang and original_lang in all_captions:
-                        selected_lang = original_lang
-                    else:
-                        for lang in ['en', 'en-US', 'en-GB']:
-                            if lang in all_captions:
-                                selected_lang = lang
-                                break
-                        if not selected_lang:
-                            selected_lang = available_langs[0]
-
-                self.log(f"Using language: {selected_lang}")
-
-                # Get subtitle URL
-                caption_url = None
-                caption_format = None
-
-                for caption in all_captions[selected_lang]:
-                    ext = caption.get('ext')
-                    if ext == 'vtt':
-                        caption_url = caption['url']
-                        caption_format = 'vtt'
-                        break
-
-                if not caption_url:
-                    for caption in all_captions[selected_lang]:
-                        ext = caption.get('ext')
-                        if ext in ['srv1', 'srv2', 'srv3', 'json3']:
-                            caption_url = caption['url']
-                            caption_format = ext
+                    # Partial match
+                    for lang in all_captions:
+                        if preferred_lang.lower() in lang.lower():
+                            selected_lang = lang
                             break
+                    if not selected_lang:
+                        return {
+                            "error": f"Language '{preferred_lang}' not found",
+                            "available_languages": available_langs
+                        }
+            else:
+                # Auto-select: original language > English > first available
+                if original_lang and original_lang in all_captions:
+                    selected_lang = original_lang
+                else:
+                    for lang in ['en', 'en-US', 'en-GB']:
+                        if lang in all_captions:
+                            selected_lang = lang
+                            break
+                    if not selected_lang:
+                        selected_lang = available_langs[0]
+
+            self.log(f"Using language: {selected_lang}")
+
+            # Get subtitle URL (first URL per format, then pick by preference)
+            fmt_map = {
+                c.get('ext'): c['url']
+                for c in reversed(all_captions[selected_lang]) if 'url' in c
+            }
+            caption_url = None
+            caption_format = None
+
+            for fmt in ('vtt', 'json3', 'srv3', 'srv2', 'srv1'):
+                caption_url = fmt_map.get(fmt)
+                if caption_url:
+                    caption_format = fmt
+                    break
+
+            if not caption_url:
+                return {"error": "Could not get subtitle URL"}
+
+            # Download subtitle
+            self.log(f"Downloading subtitles ({caption_format})...")
+            response = SESSION.get(caption_url)
+            response.raise_for_status()
+
+            # Parse
+            if caption_format == 'json3':
+                transcript = self._parse_json3(response.text)
+            else:
+                transcript = self._parse_vtt(response.text)
+
+            return {
+                "title": title,
+                "video_id": video_id,
+                "channel": channel,
+                "duration": duration,
+                "language": selected_lang,
+                "available_languages": available_langs,
+                "transcript": transcript
+            }
+
+        except yt_dlp.utils.DownloadError as e:
+            return {"error": f"Download error: {str(e)}"}
+        except Exception as e:
+            return {"error": f"Error: {str(e)}"}
 
-                if not caption_url:
-                    return {"error": "Could not get subtitle URL"}
+    def get_transcripts(self, video_urls: list[str], preferred_lang: Optional[str] = None,
+                        max_workers: int = 4) -> list[dict]:
+        """Get transcripts for several videos concurrently, in input order"""
+        if len(video_urls) == 1:
+            return [self.get_transcript(video_urls[0], preferred_lang)]
 
-                # Download subtitle
-                self.log(f"Downloading subtitles ({caption_format})...")
-                response = requests.get(caption_url)
-                response.raise_for_status()
+        def worker(url: str) -> dict:
+            self._local.log_prefix = f"[{self.extract_video_id(url) or url}] "
+            return self.get_transcript(url, preferred_lang)
 
-                # Parse
-                if caption_format == 'json3':
-                    transcript = self._parse_json3(response.text)
-                else:
-                    transcript = self._parse_vtt(response.text)
-
-                return {
-                    "title": title,
-                    "video_id": video_id,
-                    "channel": channel,
-                    "duration": duration,
-                    "language": selected_lang,
-                    "available_languages": available_langs,
-                    "transcript": transcript
-                }
-
-            except yt_dlp.utils.DownloadError as e:
-                return {"error": f"Download error: {str(e)}"}
-            except Exception as e:
-                return {"error": f"Error: {str(e)}"}
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(video_urls))) as pool:
+            return list(pool.map(worker, video_urls))
 
     def _parse_vtt(self, text: str) -> str:
         # Handle M3U8 playlist
         if text.startswith('#EXTM3U'):
-            urls = re.findall(r'https://[^\s]+', text)
+            urls = M3U8_URL_RE.findall(text)
             if urls:
                 try:
-                    response = requests.get(urls[0])
+                    response = SESSION.get(urls[0])
                     text = response.text
                 except:
                     pass
 
         lines = []
-        for line in text.split('\n'):
-            if line.startswith('WEBVTT'):
-                continue
-            if '-->' in line:
-                continue
-            if not line.strip() or line.strip().isdigit():
+        for raw in text.splitlines():
+            line = raw.strip()
+            if not line or line.isdigit() or line.startswith('WEBVTT') or '-->' in line:
                 continue
 
-            # Clean HTML tags
-            clean = re.sub('<[^>]+>', '', line)
-            clean = clean.replace('&nbsp;', ' ')
-            clean = clean.replace('&amp;', '&')
-            clean = clean.replace('&lt;', '<')
-            clean = clean.replace('&gt;', '>')
-            clean = clean.replace('&quot;', '"')
+            # Clean HTML tags and decode entities
+            clean = VTT_TAG_RE.sub('', line)
+            if '&' in clean:
+                clean = html.unescape(clean).replace('\xa0', ' ')  # &nbsp; -> space
 
-            if clean.strip():
-                lines.append(clean.strip())
+            clean = clean.strip()
+            if clean:
+                lines.append(clean)
 
         # Remove consecutive duplicates
-        result = []
-        prev = None
-        for line in lines:
-            if line != prev:
-                result.append(line)
-                prev = line
-
-        return '\n'.join(result)
+        return '\n'.join(line for line, _ in groupby(lines))
 
     def _parse_json3(self, text: str) -> str:
         try:
@@ -218,14 +303,7 @@ class YouTubeTranscriptDownloader:
                             lines.append(line)
 
             # Remove consecutive duplicates
-            result = []
-            prev = None
-            for line in lines:
-                if line != prev:
-                    result.append(line)
-                    prev = line
-
-            return '\n'.join(result)
+            return '\n'.join(line for line, _ in groupby(lines))
 
         except json.JSONDecodeError:
             return self._parse_vtt(text)
@@ -235,60 +313,100 @@ def main():
     parser = argparse.ArgumentParser(
         description="Download YouTube video transcripts"
     )
-    parser.add_argument("url", help="YouTube video URL")
+    parser.add_argument("urls", nargs="*", metavar="url", help="YouTube video URL(s)")
     parser.add_argument("--lang", "-l", help="Preferred language code (e.g., en, zh-Hant)")
     parser.add_argument("--list-langs", action="store_true", help="List available languages")
     parser.add_argument("--json", action="store_true", help="Output as JSON")
     parser.add_argument("--copy", action="store_true", help="Copy to clipboard")
     parser.add_argument("--quiet", "-q", action="store_true", help="Suppress progress messages")
+    parser.add_argument("--batch", action="store_true",
+                        help="Read newline-separated URLs from stdin")
+    parser.add_argument("--no-cache", action="store_true",
+                        help="Bypass the on-disk transcript cache")
 
     args = parser.parse_args()
 
-    downloader = YouTubeTranscriptDownloader(quiet=args.quiet or args.json)
+    if args.batch:
+        if args.urls:
+            parser.error("URLs are read from stdin with --batch; don't pass them as arguments")
+        urls = [line.strip() for line in sys.stdin if line.strip()]
+        if not urls:
+            return  # Empty batch: nothing to do, same as the other scripts
+    elif args.urls:
+        urls = args.urls
+    else:
+        parser.error("at least one URL is required unless --batch is given")
 
-    # Validate URL
-    video_id = downloader.extract_video_id(args.url)
-    if not video_id:
-        print("Error: Invalid YouTube URL", file=sys.stderr)
-        sys.exit(1)
+    downloader = YouTubeTranscriptDownloader(quiet=args.quiet or args.json,
+                                             use_cache=not args.no_cache)
 
-    result = downloader.get_transcript(args.url, preferred_lang=args.lang)
+    multiple = args.batch or len(urls) > 1
+    failed = False
 
-    # Handle errors
-    if "error" in result:
-        if args.json:
-            print(json.dumps(result, indent=2))
+    # Validate URLs, reporting and dropping invalid ones
+    valid_urls = []
+    for url in urls:
+        if downloader.extract_video_id(url):
+            valid_urls.append(url)
         else:
-            print(f"Error: {result['error']}", file=sys.stderr)
-            if "available_languages" in result:
-                print(f"Available: {', '.join(result['available_languages'])}", file=sys.stderr)
-        sys.exit(1)
+            print(f"Error: Invalid YouTube URL: {url}", file=sys.stderr)
+            failed = True
+    urls = valid_urls
+    if not urls:
+        sys.exit(1)  # Every URL was invalid and has been reported above
+
+    results = downloader.get_transcripts(urls, preferred_lang=args.lang)
+    transcripts = []
+
+    for url, result in zip(urls, results):
+        # Handle errors
+        if "error" in result:
+            failed = True
+            if not args.json:
+                prefix = f"{url}: " if multiple else ""
+                print(f"Error: {prefix}{result['error']}", file=sys.stderr)
+                if "available_languages" in result:
+                    print(f"Available: {', '.join(result['available_languages'])}", file=sys.stderr)
+            continue
 
-    # List languages only
-    if args.list_langs:
         if args.json:
-            print(json.dumps({"available_languages": result["available_languages"]}, indent=2))
+            continue
+
+        if multiple:
+            print(f"## {result['title']}")
+
+        # List languages only
+        if args.list_langs:
+            print("Available languages:\n" + "\n".join(f"  {lang}" for lang in result["available_languages"]))
         else:
-            print("Available languages:")
-            for lang in result["available_languages"]:
-                print(f"  {lang}")
-        sys.exit(0)
+            print(result["transcript"])
+            transcripts.append(result["transcript"])
 
-    # Output
+        if multiple:
+            print()
+
+    # JSON output: a single object for one URL, a list for several
     if args.json:
-        print(json.dumps(result, indent=2, ensure_ascii=False))
-    else:
-        print(result["transcript"])
+        if args.list_langs:
+            results = [
+                r if "error" in r else {"available_languages": r["available_languages"]}
+                for r in results
+            ]
+        print(dumps(results if multiple else results[0]))
+        transcripts = [r["transcript"] for r in results if "transcript" in r]
 
     # Copy to clipboard
-    if args.copy:
+    if args.copy and transcripts:
         try:
             import pyperclip
-            pyperclip.copy(result["transcript"])
+            pyperclip.copy("\n\n".join(transcripts))
             print("\nCopied to clipboard!", file=sys.stderr)
         except Exception as e:
             print(f"\nCould not copy to clipboard: {e}", file=sys.stderr)
 
+    if failed:
+        sys.exit(1)
+
 
 if __name__ == "__main__":
     main()